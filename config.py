@@ -1,7 +1,14 @@
+import os
+
+# Chemins surchargeables par variables d'environnement (SCRAPING_URLS_FILE, SCRAPING_OUTPUT_ROOT,
+# SCRAPING_VISITED_FILE) ou par les options de la CLI (python main.py --help)
+# Par défaut, relatifs au dossier du projet
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Fichier CSV d'entrée
-URLS_FILE_PATH = r"C:\Users\Admin\ARC CONSEIL\Communication site - Documents\03 Projets\04 Assistant IA Dynamics\Code Scrapping\WebScrapping V2\flat\url.csv"
+URLS_FILE_PATH = os.environ.get("SCRAPING_URLS_FILE", os.path.join(PROJECT_DIR, "flat", "url.csv"))
 
-OUTPUT_ROOT =  r"C:\Users\Admin\ARC CONSEIL\Communication site - Documents\03 Projets\04 Assistant IA Dynamics\Code Scrapping\WebScrapping V2\flat"
+OUTPUT_ROOT = os.environ.get("SCRAPING_OUTPUT_ROOT", os.path.join(PROJECT_DIR, "flat"))
 
 # Mots-clés pour ignorer certaines URLs
 UNWANTED_KEYWORDS = [
@@ -10,12 +17,42 @@ UNWANTED_KEYWORDS = [
     "contact", "Business Central"
 ]
 
-VISITED_FILE = "visited.txt"
+VISITED_FILE = os.environ.get("SCRAPING_VISITED_FILE", "visited.txt")
 
 MAX_CONCURRENCY = 5
 
+# Moteur de crawl (engine.py) : concurrence de chaque étape et taille des files entre étapes
+FETCH_CONCURRENCY = MAX_CONCURRENCY  # onglets Chromium en parallèle
+EXTRACT_CONCURRENCY = 2              # conversions HTML -> markdown (threads)
+WRITE_CONCURRENCY = 1                # écritures des fichiers markdown
+QUEUE_SIZE = 2 * MAX_CONCURRENCY
+
 # Crée le dossier de sortie
 OUTPUT_DIR = "scraped_articles"
 
 TIMEOUTCALL = 60000
-TIMEOUTWAIT = 2000
\ No newline at end of file
+TIMEOUTWAIT = 2000
+
+# Limites de crawl par défaut (surchargées par les colonnes du CSV :
+# max_depth, max_pages, time_budget, include, exclude, priority, max_listing_pages, max_empty_pages)
+# 0 = pas de limite
+# max_depth = nombre de liens suivis depuis l'URL de départ (un article de blog est à la profondeur 1
+# de sa page de listing ; le nombre de pages de listing est limité par max_listing_pages)
+MAX_DEPTH = 0
+MAX_PAGES = 0
+TIME_BUDGET = 0  # secondes (le CSV accepte aussi "90s", "30m", "2h")
+
+# Mode Blog : nombre max de pages de listing (colonne max_listing_pages) et de pages vides consécutives
+MAX_LISTING_PAGES = 1000
+MAX_EMPTY_PAGES = 3
+
+# Motifs d'URL de faible valeur, visités en dernier par la frontière
+LOW_VALUE_PATTERNS = [
+    r"/tags?/", r"/category/", r"/categories/", r"/author/",
+    r"/archives?/", r"[?&]page=\d+", r"/page/\d+",
+]
+
+# Cache du HTML rendu (render_cache.py) : relancer l'extraction avec --from-cache sans Chromium
+RENDER_CACHE_ENABLED = True
+RENDER_CACHE_DIR = os.environ.get("SCRAPING_RENDER_CACHE", "")  # vide = OUTPUT_ROOT/.render_cache
+RENDER_CACHE_MAX_MB = int(os.environ.get("SCRAPING_RENDER_CACHE_MAX_MB", "2048"))
@@ -0,0 +1,226 @@
+import asyncio
+import gzip
+import re
+import xml.etree.ElementTree as ET
+from urllib.parse import urlparse
+from utils import clean_link_fragment, has_unwanted_keyword
+from logger import setup_error_logger, log_network_error
+
+# Stratégies de découverte du moteur de crawl (engine.py), une par valeur de la colonne "type" du CSV
+#   seeds()                      : URLs de départ poussées dans la frontière
+#   more(engine)                 : découvre de nouvelles URLs quand la frontière se vide ; False si épuisée
+#   filter_links(links, visited) : liens à suivre depuis une page visitée (follow_links = True)
+#   mode                         : règles d'extraction utilisées (extraction.EXTRACTION_RULES)
+
+error_logger = setup_error_logger("scraper")
+
+_PAGINATION_RE = re.compile(r'page[/=]\d+')
+
+
+def detect_pagination_format(url):
+    """
+    Détecte le format de pagination d'une URL
+    Retourne: ('query', 'page') pour ?page=X ou ('path', 'page') pour /page/X/
+    """
+    if "page=" in url:
+        return "query", "page"
+    elif re.search(r'/page/\d+/?', url):
+        return "path", "page"
+    else:
+        # Fallback - essayer de détecter d'autres patterns
+        return "query", "page"
+
+def build_next_page_url(base_url, page_num, format_type, param_name):
+    """
+    Construit l'URL de la page suivante selon le format détecté
+    """
+    if format_type == "query":
+        # Format: ?page=X ou &page=X
+        if f"{param_name}=" in base_url:
+            # Remplacer le numéro existant
+            pattern = rf"({param_name}=)\d+"
+            return re.sub(pattern, rf"\g<1>{page_num}", base_url)
+        else:
+            # Ajouter le paramètre
+            separator = "&" if "?" in base_url else "?"
+            return f"{base_url}{separator}{param_name}={page_num}"
+
+    elif format_type == "path":
+        # Format: /page/X/
+        if f"/{param_name}/" in base_url:
+            pattern = rf"(/{param_name}/)\d+(/?)$"
+            return re.sub(pattern, rf"\g<1>{page_num}\g<2>", base_url)
+        else:
+            # Ajouter à la fin
+            return f"{base_url.rstrip('/')}/{param_name}/{page_num}/"
+
+    return base_url
+
+
+class LinkDiscovery:
+    """Type "Base" : on part d'une URL de base et on suit tous les liens qui commencent par elle"""
+
+    mode = "Base"
+    follow_links = True
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+
+    def seeds(self):
+        return [self.base_url]
+
+    async def more(self, engine):
+        return False
+
+    def filter_links(self, links, visited_pages):
+        filtered_links = []
+        for link in links:
+            clean_link = clean_link_fragment(link)
+            if clean_link.startswith(self.base_url) \
+            and clean_link not in visited_pages \
+            and not has_unwanted_keyword(clean_link):
+                filtered_links.append(clean_link)
+        return filtered_links
+
+
+class PaginationDiscovery:
+    """Type "Blog" : parcourt les pages de listing (?page=X ou /page/X/) et en extrait les articles"""
+
+    mode = "Blog"
+    follow_links = False
+
+    def __init__(self, base_url, article_selector=""):
+        self.base_url = base_url
+        self.article_selector = article_selector
+        self.base_domain = urlparse(base_url).netloc
+        self.format_type, self.param_name = detect_pagination_format(base_url)
+        self.current_page = 0
+        self.empty_pages_count = 0
+        self.stopped = False
+
+    def seeds(self):
+        return []
+
+    def listing_url(self, page_num):
+        if page_num == 1:
+            return self.base_url
+        return build_next_page_url(self.base_url, page_num, self.format_type, self.param_name)
+
+    def filter_links(self, links, visited_pages):
+        # Garder seulement les liens du même domaine, hors URLs indésirables et pages de pagination
+        filtered_links = []
+        for link in links:
+            clean_link = clean_link_fragment(link)
+            if urlparse(clean_link).netloc == self.base_domain \
+            and not has_unwanted_keyword(clean_link) \
+            and not _PAGINATION_RE.search(clean_link.lower()):
+                filtered_links.append(clean_link)
+        return filtered_links
+
+    async def more(self, engine):
+        limits = engine.limits
+        if self.stopped or self.empty_pages_count >= limits.max_empty_pages:
+            return False
+        if self.current_page >= limits.max_listing_pages:
+            print(f"    🛑 Maximum page limit reached ({limits.max_listing_pages}), stopping.")
+            return False
+
+        self.current_page += 1
+        current_url = self.listing_url(self.current_page)
+        print(f"\n📖 Processing page {self.current_page}: {current_url}")
+
+        links = await engine.render_links(current_url, self.article_selector)
+        if links is None:
+            # Page de listing en erreur (déjà loggée) : comptée comme vide, sans arrêter la source
+            self.empty_pages_count += 1
+            print(f"    ❌ Page {self.current_page} could not be loaded (empty count: {self.empty_pages_count})")
+            return True
+
+        article_links = self.filter_links(links, engine.visited_pages)
+        if not article_links:
+            self.empty_pages_count += 1
+            print(f"    ❌ No articles found on page {self.current_page} (empty count: {self.empty_pages_count})")
+            # Si c'est la première page et qu'elle est vide, arrêter immédiatement
+            if self.current_page == 1:
+                print("    🛑 First page is empty, stopping.")
+                self.stopped = True
+            return True
+
+        self.empty_pages_count = 0
+        print(f"    ✅ Found {len(article_links)} articles on page {self.current_page}")
+        # Un article est à un lien de sa page de listing (max_depth ne limite pas la pagination)
+        for article_url in article_links:
+            engine.frontier.push(article_url, depth=1)
+        return True
+
+
+class SitemapDiscovery:
+    """Type "Sitemap" : lit un sitemap XML (ou un index de sitemaps) ; param3 = préfixe d'URL à garder"""
+
+    mode = "Sitemap"
+    follow_links = False
+
+    def __init__(self, sitemap_url, url_prefix=""):
+        self.sitemap_url = sitemap_url
+        self.url_prefix = url_prefix
+        self.pending = [sitemap_url]
+        self.seen = set()
+
+    def seeds(self):
+        return []
+
+    def filter_links(self, links, visited_pages):
+        return []
+
+    async def more(self, engine):
+        while self.pending:
+            sitemap_url = self.pending.pop(0)
+            if sitemap_url in self.seen:
+                continue
+            self.seen.add(sitemap_url)
+            print(f"\n🗺️ Reading sitemap: {sitemap_url}")
+            try:
+                sitemaps, pages = await asyncio.to_thread(self._read_sitemap, sitemap_url)
+            except Exception as e:
+                print(f"    ⚠️ Sitemap error {sitemap_url}: {type(e).__name__}: {e}")
+                log_network_error(error_logger, sitemap_url, str(e))
+                continue
+
+            self.pending.extend(sitemaps)
+            added = 0
+            for page_url in pages:
+                clean_url = clean_link_fragment(page_url)
+                if self.url_prefix and not clean_url.startswith(self.url_prefix):
+                    continue
+                if has_unwanted_keyword(clean_url):
+                    continue
+                added += engine.frontier.push(clean_url, depth=0)
+            print(f"    ✅ {added} pages, {len(sitemaps)} child sitemaps")
+            return True
+        return False
+
+    @staticmethod
+    def _read_sitemap(sitemap_url):
+        """Télécharge et analyse un sitemap ; retourne (sitemaps enfants, pages)"""
+        import requests
+
+        response = requests.get(sitemap_url, timeout=30)
+        response.raise_for_status()
+        content = response.content
+        # Sitemaps compressés (.xml.gz) servis sans Content-Encoding
+        if content[:2] == b"\x1f\x8b":
+            content = gzip.decompress(content)
+
+        root = ET.fromstring(content)
+        sitemaps, pages = [], []
+        for element in root:
+            tag = element.tag.rsplit('}', 1)[-1]
+            loc = next((child.text.strip() for child in element
+                        if child.tag.rsplit('}', 1)[-1] == "loc" and child.text), None)
+            if not loc:
+                continue
+            if tag == "sitemap":
+                sitemaps.append(loc)
+            elif tag == "url":
+                pages.append(loc)
+        return sitemaps, pages
@@ -0,0 +1,382 @@
+import asyncio
+import os
+from urllib.parse import urlparse
+import config
+from config import TIMEOUTCALL, TIMEOUTWAIT
+from extraction import ExtractionError, get_profile
+from frontier import CrawlLimits, Frontier
+from render_cache import flush_render_cache, store_rendered_page
+from utils import save_visited_url, save_markdown, sanitize_filename
+from logger import setup_error_logger, log_pdf_error, log_scraping_error, log_network_error
+
+# Moteur de crawl commun à tous les types de source :
+#   découverte (discovery.py) -> frontière -> fetch (Chromium) -> extraction -> écriture markdown
+# Chaque étape a sa propre concurrence (config.FETCH_CONCURRENCY, EXTRACT_CONCURRENCY, WRITE_CONCURRENCY)
+# et les files bornées entre étapes (config.QUEUE_SIZE) font attendre l'étape précédente si la suivante sature.
+# Un seul navigateur est lancé par source ; chaque worker de fetch réutilise son onglet.
+# La découverte (discovery.more) tourne dans sa propre tâche dès que la frontière passe sous FETCH_CONCURRENCY URLs :
+# la page de listing suivante est rendue pendant le fetch des articles de la précédente.
+
+# Logger global pour ce module (le fichier de logs n'est créé qu'à la première erreur)
+error_logger = setup_error_logger("scraper")
+
+LINKS_JS = '''() => {
+    const set = new Set();
+    document.querySelectorAll('a[href]').forEach(a => {
+        try {
+            const link = new URL(a.href, document.baseURI).href;
+            set.add(link);
+        } catch {}
+    });
+    return Array.from(set);
+}'''
+
+# Premier lien de chaque élément correspondant au sélecteur d'articles (param3 en mode Blog)
+ARTICLE_LINKS_JS = '''selector => {
+    const links = new Set();
+    document.querySelectorAll(selector).forEach(article => {
+        const link = article.querySelector('a[href]');
+        if (link) {
+            try {
+                const url = new URL(link.href, document.baseURI).href;
+                links.add(url);
+            } catch {}
+        }
+    });
+    return Array.from(links);
+}'''
+
+_STOP = object()
+
+
+def download_pdf_sync(url, project_dir, visited_pages):
+    """Télécharge un fichier PDF avec requests"""
+    import requests
+
+    try:
+        normalized_url = url.rstrip('/').lower()
+        if normalized_url in visited_pages:
+            return False
+
+        print(f"    📄 Téléchargement PDF: {url}")
+
+        response = requests.get(url, stream=True, timeout=30)
+        response.raise_for_status()
+
+        # Créer le nom de fichier
+        parsed_url = urlparse(url)
+        filename = os.path.basename(parsed_url.path)
+        if not filename.endswith('.pdf'):
+            filename = sanitize_filename(url) + '.pdf'
+
+        # Créer le dossier PDF
+        pdf_dir = os.path.join(project_dir, "PDFs")
+        os.makedirs(pdf_dir, exist_ok=True)
+
+        # Sauvegarder le PDF
+        file_path = os.path.join(pdf_dir, filename)
+        with open(file_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                f.write(chunk)
+
+        print(f"    ✅ PDF sauvé: {file_path}")
+        visited_pages.add(normalized_url)
+        save_visited_url(normalized_url)
+        return True
+
+    except requests.exceptions.RequestException as e:
+        error_msg = f"Erreur réseau PDF {url}: {type(e).__name__}: {e}"
+        print(f"    ⚠️ {error_msg}")
+        log_pdf_error(error_logger, url, str(e))
+    except OSError as e:
+        error_msg = f"Erreur fichier PDF {url}: {type(e).__name__}: {e}"
+        print(f"    ⚠️ {error_msg}")
+        log_pdf_error(error_logger, url, f"File system error: {e}")
+    except Exception as e:
+        error_msg = f"Erreur PDF {url}: {type(e).__name__}: {e}"
+        print(f"    ⚠️ {error_msg}")
+        log_pdf_error(error_logger, url, str(e))
+    return False
+
+
+def _log_fetch_error(url, e, context):
+    # Déterminer le type d'erreur
+    if "timeout" in str(e).lower() or "net::" in str(e).lower():
+        log_network_error(error_logger, url, str(e))
+    else:
+        log_scraping_error(error_logger, url, str(e), context)
+
+
+class CrawlEngine:
+    """Crawl d'une source du CSV : une stratégie de découverte, un profil d'extraction, un dossier de sortie"""
+
+    def __init__(self, discovery, main_div_name, keep_div_name, project_dir, visited_pages, visited_urls_from_file, limits=None, source=None):
+        self.discovery = discovery
+        self.source = source
+        self.profile = get_profile(main_div_name, keep_div_name, discovery.mode)
+        self.project_dir = project_dir
+        self.visited_pages = visited_pages
+        self.visited_urls_from_file = visited_urls_from_file
+        self.limits = limits or CrawlLimits()
+        self.frontier = Frontier(self.limits)
+
+        self.fetch_concurrency = config.FETCH_CONCURRENCY
+        self.extract_concurrency = config.EXTRACT_CONCURRENCY
+        self.write_concurrency = config.WRITE_CONCURRENCY
+        self.fetch_queue = asyncio.Queue(maxsize=config.QUEUE_SIZE)
+        self.extract_queue = asyncio.Queue(maxsize=config.QUEUE_SIZE)
+        self.write_queue = asyncio.Queue(maxsize=config.QUEUE_SIZE)
+
+        # Pages envoyées au fetch et pas encore terminées (leurs liens peuvent encore remplir la frontière)
+        self._pending = 0
+        self._progress = asyncio.Event()
+        # Réveille la tâche de découverte quand la frontière passe sous fetch_concurrency URLs
+        self._frontier_low = asyncio.Event()
+        self._discovery_done = False
+        # Raison de l'arrêt si le navigateur ne peut plus ouvrir d'onglet (fatal pour la source)
+        self._fatal = None
+        self._tabs = None
+        self._context = None
+        self.saved = 0
+        self.failed = 0
+
+    def _is_visited(self, url):
+        normalized_url = url.rstrip('/').lower()
+        return normalized_url in self.visited_pages or normalized_url in self.visited_urls_from_file
+
+    async def run(self):
+        self.limits.start()
+        for seed in self.discovery.seeds():
+            self.frontier.push(seed, depth=0, seed=True)
+
+        try:
+            await self._crawl()
+        finally:
+            # Les pages du cache de rendu sont écrites par un thread : attendre qu'il ait terminé, même après une erreur
+            await asyncio.to_thread(flush_render_cache)
+
+        print(f"\n🎉 Crawl completed!")
+        print(f"    📊 Pages fetched: {self.limits.pages_fetched}")
+        print(f"    📄 Pages saved: {self.saved} | failed: {self.failed}")
+        print(f"    📁 Saved in: {self.project_dir}")
+        return self.saved
+
+    async def _crawl(self):
+        """Lance le navigateur et les étapes du pipeline, puis les arrête dans l'ordre"""
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                context = await browser.new_context()
+                # Un onglet par worker de fetch + un pour la découverte (pages de listing)
+                self._tabs = asyncio.Queue()
+                for _ in range(self.fetch_concurrency + 1):
+                    self._tabs.put_nowait(await context.new_page())
+                self._context = context
+
+                fetchers = [asyncio.create_task(self._fetch_worker()) for _ in range(self.fetch_concurrency)]
+                extractors = [asyncio.create_task(self._extract_worker()) for _ in range(self.extract_concurrency)]
+                writers = [asyncio.create_task(self._write_worker()) for _ in range(self.write_concurrency)]
+
+                discoverer = asyncio.create_task(self._discover())
+
+                try:
+                    await self._schedule()
+                finally:
+                    discoverer.cancel()
+                    await asyncio.gather(discoverer, return_exceptions=True)
+                    if self._fatal:
+                        # Navigateur perdu : inutile d'attendre les fetchs en cours ni de vider la file
+                        for task in fetchers:
+                            task.cancel()
+                        await asyncio.gather(*fetchers, return_exceptions=True)
+                    # Arrêt étape par étape : chaque étape vide sa file avant que la suivante ne s'arrête
+                    for stage_queue, workers in ((self.fetch_queue, fetchers),
+                                                 (self.extract_queue, extractors),
+                                                 (self.write_queue, writers)):
+                        for task in workers:
+                            if not task.done():
+                                await stage_queue.put(_STOP)
+                        await asyncio.gather(*workers, return_exceptions=True)
+            finally:
+                await browser.close()
+
+    async def _discover(self):
+        """Étape de découverte : appelle discovery.more() tant que la frontière a moins de fetch_concurrency URLs"""
+        try:
+            while True:
+                while len(self.frontier) >= self.fetch_concurrency:
+                    self._frontier_low.clear()
+                    await self._frontier_low.wait()
+                try:
+                    if not await self.discovery.more(self):
+                        return
+                except Exception as e:
+                    print(f"    ⚠️ Discovery error: {type(e).__name__}: {e}")
+                    log_scraping_error(error_logger, self.source, str(e), "Discovery stage error")
+                    return
+                self._progress.set()
+        finally:
+            self._discovery_done = True
+            self._progress.set()
+
+    async def _schedule(self):
+        """Envoie les URLs de la frontière au fetch, par ordre de priorité (la file bornée du fetch fait attendre)"""
+        while True:
+            reason = self._fatal or self.limits.exhausted()
+            if reason:
+                print(f"    🛑 {reason}, {len(self.frontier)} URLs left in frontier, stopping.")
+                return
+
+            if len(self.frontier) < self.fetch_concurrency:
+                self._frontier_low.set()
+
+            if self.frontier:
+                url, depth = self.frontier.pop()
+                if self._is_visited(url):
+                    continue
+                self.limits.count_page()
+                self._pending += 1
+                await self.fetch_queue.put((url, depth))
+            elif self._pending or not self._discovery_done:
+                # Attendre qu'une page en cours de fetch ou la découverte ajoute des URLs (ou se termine)
+                self._progress.clear()
+                await self._progress.wait()
+            else:
+                return
+
+    async def _borrow_tab(self):
+        return await self._tabs.get()
+
+    async def _return_tab(self, page, broken=False):
+        if broken:
+            # Après une erreur l'onglet peut être dans un état incertain : on le remplace
+            try:
+                await page.close()
+            except Exception:
+                pass
+            try:
+                page = await asyncio.wait_for(self._context.new_page(), TIMEOUTCALL / 1000)
+            except Exception as e:
+                # Sans nouvel onglet la source s'arrête ; l'ancien est rendu pour qu'aucun worker n'attende indéfiniment
+                if not self._fatal:
+                    self._fatal = f"browser lost ({type(e).__name__}: {e})"
+                    print(f"    ⚠️ Cannot open a new tab: {type(e).__name__}: {e}")
+                    log_scraping_error(error_logger, self.source, str(e), "Browser tab error")
+                self._progress.set()
+        self._tabs.put_nowait(page)
+
+    async def render_links(self, url, article_selector=""):
+        """Charge une page (listing) et retourne ses liens ; None en cas d'erreur"""
+        page = await self._borrow_tab()
+        broken = False
+        try:
+            await page.goto(url, timeout=TIMEOUTCALL, wait_until="networkidle")
+            await page.wait_for_timeout(TIMEOUTWAIT)
+            if article_selector:
+                return await page.evaluate(ARTICLE_LINKS_JS, article_selector)
+            return await page.evaluate(LINKS_JS)
+        except Exception as e:
+            broken = True
+            print(f"    ⚠️ Error accessing {url}: {type(e).__name__}: {e}")
+            log_network_error(error_logger, url, str(e))
+            return None
+        finally:
+            await self._return_tab(page, broken)
+
+    async def _fetch_worker(self):
+        while True:
+            item = await self.fetch_queue.get()
+            if item is _STOP:
+                return
+            url, depth = item
+            try:
+                # Les pages sont comptées à l'envoi (budget de pages) ; le budget de temps, lui,
+                # est revérifié ici pour ne pas visiter les URLs encore en file après l'échéance
+                if self._fatal or self.limits.out_of_time():
+                    self.limits.uncount_page()
+                else:
+                    await self._fetch(url, depth)
+            except Exception as e:
+                print(f"    ⚠️ Error fetching {url}: {type(e).__name__}: {e}")
+                log_scraping_error(error_logger, url, str(e), "Fetch stage error")
+            finally:
+                self._pending -= 1
+                self._progress.set()
+
+    async def _fetch(self, url, depth):
+        if self._is_visited(url):
+            return
+
+        # Vérifier si c'est un PDF
+        if url.lower().endswith('.pdf'):
+            await asyncio.to_thread(download_pdf_sync, url, self.project_dir, self.visited_pages)
+            return
+
+        normalized_url = url.rstrip('/').lower()
+        page = await self._borrow_tab()
+        broken = False
+        try:
+            print(f"    🌐 Visiting: {normalized_url}")
+            response = await page.goto(url, timeout=TIMEOUTCALL, wait_until="networkidle")
+            await page.wait_for_timeout(TIMEOUTWAIT)
+
+            final_url = (await page.evaluate("window.location.href")).lower().rstrip('/')
+            if final_url != normalized_url and final_url in self.visited_pages:
+                return
+
+            self.visited_pages.add(normalized_url)
+            save_visited_url(normalized_url)
+
+            html = await page.content()
+            store_rendered_page(final_url, html, url, response, source=self.source)
+
+            links = await page.evaluate(LINKS_JS) if self.discovery.follow_links else []
+        except Exception as e:
+            broken = True
+            self.failed += 1
+            print(f"    ⚠️ Error fetching {normalized_url}: {type(e).__name__}: {e}")
+            _log_fetch_error(url, e, "General scraping error")
+            return
+        finally:
+            await self._return_tab(page, broken)
+
+        for link in self.discovery.filter_links(links, self.visited_pages):
+            self.frontier.push(link, depth + 1)
+        await self.extract_queue.put((url, final_url, html))
+
+    async def _extract_worker(self):
+        while True:
+            item = await self.extract_queue.get()
+            if item is _STOP:
+                return
+            url, final_url, html = item
+            try:
+                markdown_content = await asyncio.to_thread(self.profile.extract, html)
+            except ExtractionError as e:
+                self.failed += 1
+                print(f"    ❌ {e}")
+                log_scraping_error(error_logger, url, str(e), e.context)
+                continue
+            except Exception as e:
+                self.failed += 1
+                print(f"    ⚠️ Error extracting {url}: {type(e).__name__}: {e}")
+                log_scraping_error(error_logger, url, str(e), "Extraction stage error")
+                continue
+            await self.write_queue.put((url, final_url, markdown_content))
+
+    async def _write_worker(self):
+        while True:
+            item = await self.write_queue.get()
+            if item is _STOP:
+                return
+            url, final_url, markdown_content = item
+            try:
+                file_path = await asyncio.to_thread(save_markdown, self.project_dir, final_url, markdown_content)
+                self.saved += 1
+                print(f"    ✅ Saved: {file_path}")
+            except OSError as e:
+                self.failed += 1
+                print(f"    ⚠️ Error writing {final_url}: {type(e).__name__}: {e}")
+                log_scraping_error(error_logger, url, f"File system error: {e}", "Write stage error")
@@ -0,0 +1,138 @@
+from functools import lru_cache
+from utils import is_blank_cell
+
+# bs4 et html2text sont importés au premier usage (démarrage rapide de la CLI)
+
+# Règles d'extraction par mode (colonne "type" du CSV)
+# Ajouter une règle ici suffit pour un nouveau mode, sans toucher à la boucle de scraping
+#   strip_tags / strip_scope : balises supprimées dans le conteneur principal ("main") ou tout le document ("document")
+#   keep_required            : échec si aucun bloc param2 n'est trouvé, y compris quand param2 est vide
+#                              (sinon on passe aux fallbacks, ou directement à tout le conteneur si param2 est vide)
+#   fallback_classes         : classes essayées dans le conteneur principal si aucun bloc param2
+#   fallback_strip_tags      : balises supprimées avant de garder tout le conteneur principal en dernier recours
+#   title                    : "content" (le markdown est préfixé par "# ") ou "title_tag" (balise <title>)
+EXTRACTION_RULES = {
+    "Base": {
+        "strip_tags": ['script', 'style', 'nav', 'footer', 'header'],
+        "strip_scope": "main",
+        "keep_required": True,
+        "fallback_classes": [],
+        "fallback_strip_tags": ['nav', 'footer', 'header', 'aside'],
+        "title": "content",
+    },
+    "Blog": {
+        "strip_tags": ['script', 'style'],
+        "strip_scope": "document",
+        "keep_required": False,
+        # Pour Dynamics Community, le contenu de l'article est dans .post-content
+        "fallback_classes": ["post-content"],
+        "fallback_strip_tags": ['nav', 'footer', 'header', 'aside'],
+        "title": "title_tag",
+    },
+}
+# Type "Sitemap" : pages hétérogènes, mêmes règles souples que le mode Blog
+EXTRACTION_RULES["Sitemap"] = EXTRACTION_RULES["Blog"]
+
+# Configuration du convertisseur html2text commune à tous les profils
+CONVERTER_OPTIONS = {
+    "ignore_links": False,
+    "body_width": 0,
+}
+
+
+class ExtractionError(Exception):
+    """Contenu introuvable dans la page (message + contexte pour le logger)"""
+
+    def __init__(self, message, context):
+        super().__init__(message)
+        self.context = context
+
+
+class ExtractionProfile:
+    """Profil d'extraction compilé une fois par ligne du CSV et réutilisé pour toutes ses pages"""
+
+    def __init__(self, main_div_name, keep_div_name, mode="Base"):
+        rules = EXTRACTION_RULES[mode]
+        self.mode = mode
+        self.main_div_name = main_div_name
+        self.keep_div_name = keep_div_name
+
+        # Gérer les attributs data-* vs classes (résolu une seule fois)
+        if main_div_name.startswith('data-'):
+            self.main_find_kwargs = {"attrs": {main_div_name: True}}
+        else:
+            self.main_find_kwargs = {"class_": main_div_name}
+
+        self.strip_tags = list(rules["strip_tags"])
+        self.strip_document = rules["strip_scope"] == "document"
+        self.keep_required = rules["keep_required"]
+        self.fallback_classes = list(rules["fallback_classes"])
+        self.fallback_strip_tags = list(rules["fallback_strip_tags"])
+        self.title = rules["title"]
+        self.converter_options = dict(CONVERTER_OPTIONS)
+
+    def new_converter(self):
+        # html2text garde un état par document (liens, listes, abréviations) :
+        # un convertisseur neuf par page, configuré à partir des options pré-calculées
+        import html2text
+
+        converter = html2text.HTML2Text()
+        for name, value in self.converter_options.items():
+            setattr(converter, name, value)
+        return converter
+
+    def select_html(self, soup):
+        """Retourne le fragment HTML à convertir, ou lève ExtractionError"""
+        main_div = soup.find("div", **self.main_find_kwargs)
+        if not main_div:
+            raise ExtractionError(f"Aucune section {self.main_div_name} trouvée", "Missing main container")
+
+        # Nettoyer les éléments indésirables
+        for tag in (soup if self.strip_document else main_div)(self.strip_tags):
+            tag.decompose()
+
+        if self.keep_div_name:
+            content_blocks = main_div.find_all("div", class_=self.keep_div_name)
+            if content_blocks:
+                return "\n".join(str(block) for block in content_blocks)
+        if self.keep_required:
+            raise ExtractionError(f"Pas de blocs .{self.keep_div_name} trouvés", "Missing content blocks")
+
+        if self.keep_div_name:
+            # Fallback: essayer de trouver le contenu principal
+            for fallback_class in self.fallback_classes:
+                fallback = main_div.find("div", class_=fallback_class)
+                if fallback:
+                    return str(fallback)
+
+        # Dernier recours: prendre tout le contenu de main_div mais nettoyer
+        for unwanted in main_div.find_all(self.fallback_strip_tags):
+            unwanted.decompose()
+        return str(main_div)
+
+    def extract(self, html):
+        """Convertit une page HTML en markdown selon le profil, ou lève ExtractionError"""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        html_snippet = self.select_html(soup)
+        article_md = self.new_converter().handle(html_snippet)
+
+        if self.title == "title_tag":
+            # Extraire le titre de la page
+            title_tag = soup.find("title")
+            page_title = title_tag.get_text().strip() if title_tag else "Article"
+            return f"# {page_title}\n\n{article_md}"
+        return f"# {article_md}"
+
+
+@lru_cache(maxsize=None)
+def _cached_profile(main_div_name, keep_div_name, mode):
+    return ExtractionProfile(main_div_name, keep_div_name, mode)
+
+
+def get_profile(main_div_name, keep_div_name, mode="Base"):
+    """Retourne le profil compilé (mis en cache) pour une ligne du CSV"""
+    main_div_name = "" if is_blank_cell(main_div_name) else str(main_div_name).strip()
+    keep_div_name = "" if is_blank_cell(keep_div_name) else str(keep_div_name).strip()
+    return _cached_profile(main_div_name, keep_div_name, mode)
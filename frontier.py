@@ -0,0 +1,177 @@
+import heapq
+import re
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+from utils import is_blank_cell
+from logger import setup_error_logger, log_error
+from config import MAX_DEPTH, MAX_PAGES, TIME_BUDGET, MAX_LISTING_PAGES, MAX_EMPTY_PAGES, LOW_VALUE_PATTERNS
+
+# Poids du score (plus le score est bas, plus l'URL est prioritaire)
+DEPTH_WEIGHT = 10.0
+PATH_WEIGHT = 1.0
+PRIORITY_BONUS = 15.0
+LOW_VALUE_PENALTY = 20.0
+FRESHNESS_BONUS = 2.0  # par année d'écart, plafonné à FRESHNESS_YEARS
+FRESHNESS_YEARS = 5
+
+_LOW_VALUE_RE = [re.compile(p, re.IGNORECASE) for p in LOW_VALUE_PATTERNS]
+_YEAR_RE = re.compile(r'(?<!\d)(?:19|20)\d{2}(?!\d)')
+_DURATION_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*$', re.IGNORECASE)
+
+error_logger = setup_error_logger("scraper")
+
+
+def _to_int(value, default):
+    """Convertit une cellule CSV en entier (cellule vide -> valeur par défaut)"""
+    if is_blank_cell(value):
+        return default
+    try:
+        return int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def _to_seconds(value, default):
+    """Convertit une durée CSV ("90", "90s", "30m", "2h") en secondes"""
+    if is_blank_cell(value):
+        return default
+    match = _DURATION_RE.match(str(value))
+    if not match:
+        return default
+    amount, unit = float(match.group(1)), match.group(2).lower()
+    return amount * {"": 1, "s": 1, "m": 60, "h": 3600}[unit]
+
+
+def _to_regex(value, column="", url=""):
+    """Compile un filtre CSV ; un motif invalide est signalé puis ignoré (la source est crawlée sans ce filtre)"""
+    if is_blank_cell(value):
+        return None
+    try:
+        return re.compile(str(value).strip(), re.IGNORECASE)
+    except re.error as e:
+        print(f"    ⚠️ Invalid {column} pattern '{value}' for {url}: {e} (ignored)")
+        log_error(error_logger, url, "CSV", f"Invalid {column} pattern '{value}': {e}", "Filter ignored")
+        return None
+
+
+class CrawlLimits:
+    """Limites de crawl d'une ligne du CSV (0 = pas de limite)"""
+
+    def __init__(self, max_depth=MAX_DEPTH, max_pages=MAX_PAGES, time_budget=TIME_BUDGET,
+                 include=None, exclude=None, priority=None,
+                 max_listing_pages=MAX_LISTING_PAGES, max_empty_pages=MAX_EMPTY_PAGES):
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.time_budget = time_budget
+        self.include = include
+        self.exclude = exclude
+        self.priority = priority
+        self.max_listing_pages = max_listing_pages
+        self.max_empty_pages = max_empty_pages
+        self.pages_fetched = 0
+        self.deadline = None
+
+    @classmethod
+    def from_entry(cls, entry):
+        """Construit les limites à partir des colonnes optionnelles d'une ligne du CSV"""
+        return cls(
+            max_depth=_to_int(entry.get('max_depth'), MAX_DEPTH),
+            max_pages=_to_int(entry.get('max_pages'), MAX_PAGES),
+            time_budget=_to_seconds(entry.get('time_budget'), TIME_BUDGET),
+            include=_to_regex(entry.get('include'), 'include', entry.get('url', '')),
+            exclude=_to_regex(entry.get('exclude'), 'exclude', entry.get('url', '')),
+            priority=_to_regex(entry.get('priority'), 'priority', entry.get('url', '')),
+            max_listing_pages=_to_int(entry.get('max_listing_pages'), MAX_LISTING_PAGES) or MAX_LISTING_PAGES,
+            max_empty_pages=_to_int(entry.get('max_empty_pages'), MAX_EMPTY_PAGES) or MAX_EMPTY_PAGES,
+        )
+
+    def start(self):
+        """Démarre le chronomètre du budget de temps"""
+        self.pages_fetched = 0
+        self.deadline = time.monotonic() + self.time_budget if self.time_budget else None
+
+    def allows(self, url):
+        """Filtre include/exclude"""
+        if self.include and not self.include.search(url):
+            return False
+        if self.exclude and self.exclude.search(url):
+            return False
+        return True
+
+    def depth_allowed(self, depth):
+        return not self.max_depth or depth <= self.max_depth
+
+    def count_page(self):
+        self.pages_fetched += 1
+
+    def uncount_page(self):
+        """Annule count_page pour une page envoyée au fetch mais jamais visitée"""
+        self.pages_fetched -= 1
+
+    def out_of_time(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def exhausted(self):
+        """Retourne la raison de l'arrêt si le budget est épuisé, sinon None"""
+        if self.max_pages and self.pages_fetched >= self.max_pages:
+            return f"page budget reached ({self.max_pages})"
+        if self.out_of_time():
+            return f"time budget reached ({self.time_budget:.0f}s)"
+        return None
+
+
+def score_url(url, depth, limits=None, current_year=None):
+    """
+    Score de priorité d'une URL (plus bas = visité plus tôt)
+    Combine la profondeur, le motif d'URL et la fraîcheur (année présente dans l'URL)
+    """
+    score = depth * DEPTH_WEIGHT
+
+    path = urlparse(url).path
+    score += path.strip('/').count('/') * PATH_WEIGHT
+
+    if limits is not None and limits.priority and limits.priority.search(url):
+        score -= PRIORITY_BONUS
+    if any(pattern.search(url) for pattern in _LOW_VALUE_RE):
+        score += LOW_VALUE_PENALTY
+
+    years = [int(y) for y in _YEAR_RE.findall(path)]
+    if years:
+        current_year = current_year or datetime.utcnow().year
+        age = max(0, current_year - max(years))
+        score -= FRESHNESS_BONUS * max(0, FRESHNESS_YEARS - age)
+
+    return score
+
+
+class Frontier:
+    """File de priorité des URLs à visiter (dédupliquée)"""
+
+    def __init__(self, limits=None):
+        self.limits = limits or CrawlLimits()
+        self._heap = []
+        self._seen = set()
+        self._counter = 0
+
+    def push(self, url, depth=0, seed=False):
+        """Ajoute une URL si elle respecte les limites ; retourne True si ajoutée
+        Les URLs de départ (seed=True) ne passent pas par les filtres include/exclude."""
+        key = url.rstrip('/').lower()
+        if key in self._seen:
+            return False
+        if not seed and (not self.limits.depth_allowed(depth) or not self.limits.allows(url)):
+            return False
+        self._seen.add(key)
+        # Le compteur garde l'ordre d'insertion (FIFO) à score égal
+        heapq.heappush(self._heap, (score_url(url, depth, self.limits), self._counter, url, depth))
+        self._counter += 1
+        return True
+
+    def pop(self):
+        """Retourne (url, depth) de l'URL la plus prioritaire"""
+        _, _, url, depth = heapq.heappop(self._heap)
+        return url, depth
+
+    def __len__(self):
+        return len(self._heap)
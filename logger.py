@@ -1,19 +1,28 @@
 import os
 import logging
 from datetime import datetime
-from config import OUTPUT_ROOT
+import config
+
+class LazyFileHandler(logging.FileHandler):
+    """FileHandler qui ne crée le dossier et le fichier de logs qu'à la première erreur"""
+
+    def __init__(self, project_name):
+        self.project_name = project_name
+        super().__init__(os.devnull, encoding='utf-8', delay=True)
+
+    def _open(self):
+        # Chemin résolu au premier log : OUTPUT_ROOT peut avoir été surchargé par la CLI
+        log_dir = os.path.join(config.OUTPUT_ROOT, "logs")
+        os.makedirs(log_dir, exist_ok=True)
+
+        # Nom du fichier avec timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.baseFilename = os.path.join(log_dir, f"{self.project_name}_errors_{timestamp}.log")
+        return super()._open()
 
 def setup_error_logger(project_name="scraper"):
     """Configure le logger pour les erreurs de scraping"""
     
-    # Créer le dossier de logs
-    log_dir = os.path.join(OUTPUT_ROOT, "logs")
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # Nom du fichier avec timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(log_dir, f"{project_name}_errors_{timestamp}.log")
-    
     # Configuration du logger
     logger = logging.getLogger('scraper_errors')
     logger.setLevel(logging.ERROR)
@@ -22,8 +31,8 @@ def setup_error_logger(project_name="scraper"):
     if logger.handlers:
         logger.handlers.clear()
     
-    # Handler pour fichier
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # Handler pour fichier (créé à la première erreur)
+    file_handler = LazyFileHandler(project_name)
     file_handler.setLevel(logging.ERROR)
     
     # Format des logs
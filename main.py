@@ -1,15 +1,20 @@
+import argparse
 import asyncio
-import os
-from utils import load_visited_urls, load_urls_from_csv
-from config import MAX_CONCURRENCY, URLS_FILE_PATH, OUTPUT_ROOT
-from fetch import fetch_pages_base
-from fetch_blog import fetch_blog_with_pagination  # ✅ Nouveau import
+import sys
+import config
+from utils import load_visited_urls, load_urls_from_csv, source_project_dir
+from frontier import CrawlLimits
+from discovery import LinkDiscovery, PaginationDiscovery, SitemapDiscovery
+from engine import CrawlEngine
 
+# playwright, bs4, html2text et requests ne sont importés qu'au moment de traiter une source :
+# --plan et --help démarrent sans eux
 
-async def main():
-    urls_data = load_urls_from_csv(URLS_FILE_PATH)
+
+async def main(urls_data=None):
+    if urls_data is None:
+        urls_data = load_urls_from_csv(config.URLS_FILE_PATH)
     visited_pages = set()
-    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
     visited_urls_from_file = load_visited_urls()
 
     for entry in urls_data:
@@ -19,28 +24,90 @@ async def main():
         param1 = entry.get('param1', '')
         param2 = entry.get('param2', '')
         param3 = entry.get('param3', '')
+        # Limites optionnelles par source : max_depth, max_pages, time_budget, include, exclude, priority
+        limits = CrawlLimits.from_entry(entry)
 
         # ✅ Sécuriser le nom du dossier
-        safe_source = source.replace("/", "_").replace("\\", "_").replace(" ", "_")
-        project_dir = os.path.join(OUTPUT_ROOT, safe_source)
+        project_dir = source_project_dir(source)
 
+        # Chaque type choisit sa stratégie de découverte ; le crawl lui-même est commun (engine.py)
         match type:
             case "Base":
-                await fetch_pages_base(url, param1, param2, semaphore, project_dir, visited_pages, visited_urls_from_file)
-            case "Blog":  # ✅ Nouveau case
-                await fetch_blog_with_pagination(url, param1, param2, param3, semaphore, project_dir, visited_pages, visited_urls_from_file)
+                print(f"\n📌 Starting scrape of: {url}")
+                discovery = LinkDiscovery(url)
+            case "Blog":
+                print(f"\n📚 Starting blog scrape with pagination: {url}")
+                discovery = PaginationDiscovery(url, param3)
+            case "Sitemap":
+                print(f"\n🗺️ Starting sitemap scrape: {url}")
+                discovery = SitemapDiscovery(url, param3)
             case "stop":
                 print("Stopping...")
+                continue
             case "pause":
                 print("Pausing...")
+                continue
             case _:
-                print("Unknown command") 
+                print("Unknown command")
+                continue
+
+        engine = CrawlEngine(discovery, param1, param2, project_dir, visited_pages, visited_urls_from_file, limits, source=source)
+        await engine.run()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scraping des sources listées dans le CSV vers des fichiers markdown")
+    parser.add_argument("--urls", help="CSV des sources (défaut : $SCRAPING_URLS_FILE ou config.URLS_FILE_PATH)")
+    parser.add_argument("--output", help="Dossier de sortie (défaut : $SCRAPING_OUTPUT_ROOT ou config.OUTPUT_ROOT)")
+    parser.add_argument("--visited", help="Fichier des URLs visitées (défaut : $SCRAPING_VISITED_FILE ou visited.txt)")
+    parser.add_argument("--source", action="append", help="Ne traiter que cette source (option répétable)")
+    parser.add_argument("--plan", action="store_true", help="Afficher les sources, les URLs de départ et le travail estimé sans lancer de navigateur")
+    parser.add_argument("--from-cache", action="store_true", help="Ré-extraire les pages du cache de rendu sans navigateur (tous les cœurs)")
+    parser.add_argument("--workers", type=int, help="Nombre de processus pour --from-cache (défaut : nombre de cœurs)")
+    parser.add_argument("--cache-dir", help="Dossier du cache de rendu (défaut : $SCRAPING_RENDER_CACHE ou OUTPUT_ROOT/.render_cache)")
+    parser.add_argument("--no-cache", action="store_true", help="Ne pas enregistrer les pages rendues dans le cache")
+    return parser.parse_args(argv)
+
+def apply_overrides(args):
+    """Les options de la CLI remplacent les chemins de config.py / des variables d'environnement"""
+    if args.urls:
+        config.URLS_FILE_PATH = args.urls
+    if args.output:
+        config.OUTPUT_ROOT = args.output
+    if args.visited:
+        config.VISITED_FILE = args.visited
+    if args.cache_dir:
+        config.RENDER_CACHE_DIR = args.cache_dir
+    if args.no_cache:
+        config.RENDER_CACHE_ENABLED = False
+
+def select_entries(urls_data, sources):
+    if not sources:
+        return urls_data
+    return [entry for entry in urls_data if entry.get('source') in sources]
+
+def cli(argv=None):
+    args = parse_args(argv)
+    apply_overrides(args)
+    urls_data = select_entries(load_urls_from_csv(config.URLS_FILE_PATH), args.source)
+
+    if args.plan:
+        from plan import print_plan
+        print_plan(urls_data, load_visited_urls())
+        return 0
+
+    if args.from_cache:
+        from reextract import reextract_from_cache
+        _, failed = reextract_from_cache(urls_data, workers=args.workers)
+        return 1 if failed else 0
 
-if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(urls_data))
     except RuntimeError as e:
         if "asyncio.run() cannot be called from a running event loop" in str(e):
-            asyncio.create_task(main())
+            asyncio.create_task(main(urls_data))
         else:
-            raise
\ No newline at end of file
+            raise
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
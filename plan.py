@@ -0,0 +1,109 @@
+import os
+import config
+from config import TIMEOUTWAIT
+from discovery import detect_pagination_format, build_next_page_url
+from frontier import CrawlLimits
+from utils import source_project_dir
+
+# Dry run : décrit ce que ferait main() pour chaque source, sans navigateur ni réseau
+
+
+def _limit(value, unit=""):
+    return f"{value:g}{unit}" if value else "∞"
+
+
+def _count_markdown(project_dir):
+    if not os.path.isdir(project_dir):
+        return 0
+    return sum(1 for name in os.listdir(project_dir) if name.endswith(".md"))
+
+
+def plan_entry(entry, visited_urls):
+    """Retourne un dict décrivant le travail prévu pour une ligne du CSV"""
+    source = entry.get('source', 'default')
+    type = entry.get('type', 'default')
+    url = entry['url'].rstrip('/')
+    limits = CrawlLimits.from_entry(entry)
+    project_dir = source_project_dir(source)
+
+    seed = url.lower()
+    known = sum(1 for visited in visited_urls if visited.startswith(seed))
+    seed_visited = seed in visited_urls
+
+    seeds = [url]
+    notes = []
+    if type == "Base":
+        if seed_visited:
+            # Le crawl s'arrête tout de suite si l'URL de départ est déjà visitée
+            estimated = 0
+            notes.append("seed already in visited file: nothing to crawl")
+        else:
+            estimated = limits.max_pages or (known or None)
+            if not limits.max_pages:
+                notes.append("no max_pages: estimate based on previous crawl" if known else "no max_pages: unbounded")
+    elif type == "Blog":
+        format_type, param_name = detect_pagination_format(url)
+        seeds.append(build_next_page_url(url, 2, format_type, param_name))
+        estimated = limits.max_pages or None
+        notes.append(f"up to {limits.max_listing_pages} listing pages, stops after {limits.max_empty_pages} empty pages")
+        if not limits.max_pages:
+            notes.append("no max_pages: article count unknown")
+    elif type == "Sitemap":
+        estimated = limits.max_pages or None
+        if entry.get('param3'):
+            notes.append(f"keeps URLs starting with {entry['param3']}")
+        if not limits.max_pages:
+            notes.append("no max_pages: page count known once the sitemap is read")
+    else:
+        estimated = 0
+        notes.append(f"type '{type}' is not crawled")
+
+    return {
+        "source": source,
+        "type": type,
+        "project_dir": project_dir,
+        "seeds": seeds,
+        "limits": limits,
+        "known_pages": known,
+        "markdown_files": _count_markdown(project_dir),
+        "estimated_pages": estimated,
+        "notes": notes,
+    }
+
+
+def print_plan(urls_data, visited_urls):
+    print(f"📋 Plan for {len(urls_data)} source(s) from {config.URLS_FILE_PATH}")
+    print(f"    📁 Output root: {config.OUTPUT_ROOT}")
+    print(f"    🗂️ Visited file: {config.VISITED_FILE} ({len(visited_urls)} URLs)")
+
+    total_pages = 0
+    unbounded = 0
+    for index, entry in enumerate(urls_data, start=1):
+        item = plan_entry(entry, visited_urls)
+        limits = item["limits"]
+        print(f"\n[{index}] {item['source']} ({item['type']}) → {item['project_dir']}")
+        for seed in item["seeds"]:
+            print(f"    🌱 Seed: {seed}")
+        if item["type"] == "Blog":
+            # Les pages de listing suivantes sont découvertes au fil du crawl
+            print("    🌱 ...")
+        print(f"    📏 Limits: max_depth={_limit(limits.max_depth)} max_pages={_limit(limits.max_pages)} "
+              f"time_budget={_limit(limits.time_budget, 's')}")
+        for name in ("include", "exclude", "priority"):
+            pattern = getattr(limits, name)
+            if pattern:
+                print(f"    🔎 {name}: {pattern.pattern}")
+        print(f"    🗂️ Already visited under seed: {item['known_pages']} | Markdown files on disk: {item['markdown_files']}")
+
+        estimated = item["estimated_pages"]
+        if estimated is None:
+            unbounded += 1
+            print("    📊 Estimated pages: unknown")
+        else:
+            total_pages += estimated
+            print(f"    📊 Estimated pages: {estimated}")
+        for note in item["notes"]:
+            print(f"    ℹ️ {note}")
+
+    print(f"\n📊 Total estimated pages: {total_pages}" + (f" (+ {unbounded} source(s) without estimate)" if unbounded else ""))
+    print(f"    ⏱️ Fixed wait alone: ≥ {total_pages * TIMEOUTWAIT / 1000:.0f}s ({TIMEOUTWAIT} ms per page)")
@@ -0,0 +1,79 @@
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+from extraction import ExtractionError, get_profile
+from frontier import CrawlLimits
+from render_cache import RenderCache
+from utils import save_markdown, source_project_dir
+from logger import setup_error_logger, log_scraping_error
+
+# Mode --from-cache : relance extraction + conversion + écriture sur le HTML du cache de rendu,
+# sans Chromium ni réseau, réparti sur tous les cœurs (ProcessPoolExecutor)
+
+error_logger = setup_error_logger("reextract")
+
+# Nombre de pages envoyées à un processus par lot (limite les allers-retours entre processus)
+CHUNKSIZE = 16
+
+
+def cached_entries_for_source(entries, entry):
+    """Pages du cache récupérées par cette ligne du CSV (colonne source enregistrée au crawl)"""
+    source = entry.get('source', 'default')
+    url = entry['url'].rstrip('/').lower()
+    limits = CrawlLimits.from_entry(entry)
+    selected = [e for e in entries if e["source"] == source]
+    # Pages mises en cache avant l'enregistrement de la source : seul le préfixe d'un type Base est fiable
+    if entry.get('type') == "Base":
+        selected += [e for e in entries if e["source"] is None and e["url"].startswith(url)]
+    return [e for e in selected if e["url"] == url or limits.allows(e["url"])]
+
+
+def _extract_cached_page(task):
+    """Exécuté dans un processus de travail : lit le blob, extrait, écrit le markdown"""
+    url, blob_path, main_div_name, keep_div_name, mode, project_dir = task
+    try:
+        with open(blob_path, "rb") as f:
+            html = gzip.decompress(f.read()).decode("utf-8")
+        markdown_content = get_profile(main_div_name, keep_div_name, mode).extract(html)
+        return url, save_markdown(project_dir, url, markdown_content), None, None
+    except ExtractionError as e:
+        return url, None, str(e), e.context
+    except Exception as e:
+        return url, None, f"{type(e).__name__}: {e}", "Cached page extraction error"
+
+
+def reextract_from_cache(urls_data, workers=None, cache=None):
+    """Ré-extrait toutes les pages en cache des sources du CSV ; retourne (réussites, échecs)"""
+    cache = cache or RenderCache()
+    all_entries = cache.entries()
+    print(f"📦 Render cache: {len(all_entries)} pages in {cache.root}")
+
+    tasks = []
+    for entry in urls_data:
+        mode = entry.get('type', 'default')
+        if mode not in ("Base", "Blog", "Sitemap"):
+            continue
+        project_dir = source_project_dir(entry.get('source', 'default'))
+        selected = cached_entries_for_source(all_entries, entry)
+        print(f"    📚 {entry.get('source', 'default')} ({mode}): {len(selected)} cached pages")
+        for cached in selected:
+            tasks.append((cached["url"], cache.blob_path(cached["blob"]),
+                          entry.get('param1', ''), entry.get('param2', ''), mode, project_dir))
+
+    if not tasks:
+        print("    ❌ No cached pages to re-extract")
+        return 0, 0
+
+    saved, failed = 0, 0
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for url, file_path, error_msg, context in executor.map(_extract_cached_page, tasks, chunksize=CHUNKSIZE):
+            if file_path:
+                saved += 1
+            else:
+                failed += 1
+                log_scraping_error(error_logger, url, error_msg, context)
+
+    cache.touch(task[0] for task in tasks)
+    print(f"\n🎉 Re-extraction completed: {saved} saved, {failed} failed ({workers} workers)")
+    return saved, failed
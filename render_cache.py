@@ -0,0 +1,234 @@
+import gzip
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+import config
+
+# Cache local du HTML rendu par Chromium, pour relancer l'extraction sans re-rendre les pages
+#   blobs/ab/abcdef....html.gz : HTML compressé, nommé par le sha256 de son contenu (dédupliqué)
+#   index.sqlite               : URL finale -> source du CSV, blob, statut HTTP, en-têtes, date de rendu, dernier accès
+# Quand la taille des blobs dépasse RENDER_CACHE_MAX_MB, les entrées les moins récemment utilisées sont supprimées
+# jusqu'à EVICT_LOW_WATER du maximum, par lots de EVICT_BATCH (jamais l'entrée qui vient d'être écrite)
+# Pendant un crawl, les écritures passent par un thread dédié (CacheWriter) pour ne pas bloquer la boucle asyncio
+
+EVICT_LOW_WATER = 0.9
+EVICT_BATCH = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    source TEXT,
+    requested_url TEXT,
+    blob TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    status INTEGER,
+    headers TEXT,
+    fetched_at TEXT,
+    last_access REAL
+);
+CREATE INDEX IF NOT EXISTS pages_blob ON pages (blob);
+CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access);
+"""
+
+
+class RenderCache:
+    """Cache adressé par contenu des pages rendues, avec éviction LRU par taille"""
+
+    def __init__(self, root=None, max_bytes=None):
+        self.root = root or config.RENDER_CACHE_DIR or os.path.join(config.OUTPUT_ROOT, ".render_cache")
+        self.max_bytes = config.RENDER_CACHE_MAX_MB * 1024 * 1024 if max_bytes is None else max_bytes
+        os.makedirs(os.path.join(self.root, "blobs"), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(self.root, "index.sqlite"))
+        self.db.executescript(_SCHEMA)
+        # Index créé avant l'ajout de la colonne source
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(pages)")]
+        if "source" not in columns:
+            self.db.execute("ALTER TABLE pages ADD COLUMN source TEXT")
+            self.db.commit()
+        self._total = self._blobs_size()
+
+    def _blobs_size(self):
+        row = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT blob, size FROM pages)").fetchone()
+        return row[0]
+
+    def blob_path(self, blob):
+        return os.path.join(self.root, "blobs", blob[:2], f"{blob}.html.gz")
+
+    def put(self, url, html, requested_url=None, status=None, headers=None, source=None):
+        """Enregistre le HTML rendu pour l'URL finale (source = colonne "source" du CSV)"""
+        data = html.encode("utf-8")
+        blob = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(blob)
+
+        referenced = self.db.execute("SELECT 1 FROM pages WHERE blob = ? LIMIT 1", (blob,)).fetchone()
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(data, compresslevel=6))
+            os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+
+        previous = self.db.execute("SELECT blob FROM pages WHERE url = ?", (url,)).fetchone()
+        self.db.execute(
+            "INSERT OR REPLACE INTO pages (url, source, requested_url, blob, size, status, headers, fetched_at, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (url, source, requested_url, blob, size, status, json.dumps(headers or {}),
+             datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"), time.time()),
+        )
+        if not referenced:
+            self._total += size
+        if previous and previous[0] != blob:
+            self._drop_blob_if_unused(previous[0])
+        self.db.commit()
+
+        if self.max_bytes and self._total > self.max_bytes:
+            self.evict(keep_url=url)
+
+    def get(self, url):
+        """Retourne le HTML en cache pour l'URL finale, ou None"""
+        entry = self.entry(url)
+        if entry is None:
+            return None
+        self.touch([url])
+        return self.read(entry["blob"])
+
+    def entry(self, url):
+        row = self.db.execute(
+            "SELECT url, source, requested_url, blob, size, status, headers, fetched_at FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def entries(self):
+        """Toutes les entrées du cache (sans le HTML)"""
+        rows = self.db.execute(
+            "SELECT url, source, requested_url, blob, size, status, headers, fetched_at FROM pages ORDER BY url"
+        )
+        return [self._row_to_entry(row) for row in rows]
+
+    def read(self, blob):
+        try:
+            with open(self.blob_path(blob), "rb") as f:
+                return gzip.decompress(f.read()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+
+    def touch(self, urls):
+        """Marque des entrées comme récemment utilisées (LRU)"""
+        now = time.time()
+        self.db.executemany("UPDATE pages SET last_access = ? WHERE url = ?", [(now, url) for url in urls])
+        self.db.commit()
+
+    def evict(self, keep_url=None):
+        """Supprime les entrées les moins récemment utilisées jusqu'à EVICT_LOW_WATER de la taille max
+        (keep_url : entrée qui vient d'être écrite, jamais supprimée même si elle dépasse seule le maximum)"""
+        target = int(self.max_bytes * EVICT_LOW_WATER)
+        while self._total > target:
+            rows = self.db.execute(
+                "SELECT url, blob FROM pages WHERE url IS NOT ? ORDER BY last_access LIMIT ?", (keep_url, EVICT_BATCH)
+            ).fetchall()
+            if not rows:
+                break
+            for url, blob in rows:
+                if self._total <= target:
+                    break
+                self.db.execute("DELETE FROM pages WHERE url = ?", (url,))
+                self._drop_blob_if_unused(blob)
+            self.db.commit()
+
+    def _drop_blob_if_unused(self, blob):
+        if self.db.execute("SELECT 1 FROM pages WHERE blob = ? LIMIT 1", (blob,)).fetchone():
+            return
+        path = self.blob_path(blob)
+        try:
+            self._total -= os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        self.db.close()
+
+    @staticmethod
+    def _row_to_entry(row):
+        url, source, requested_url, blob, size, status, headers, fetched_at = row
+        return {
+            "url": url,
+            "source": source,
+            "requested_url": requested_url,
+            "blob": blob,
+            "size": size,
+            "status": status,
+            "headers": json.loads(headers) if headers else {},
+            "fetched_at": fetched_at,
+        }
+
+
+class CacheWriter:
+    """Thread dédié aux écritures du cache : compression, sqlite et éviction hors de la boucle asyncio
+    (la connexion sqlite est créée et utilisée uniquement dans ce thread)"""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="render-cache-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        cache = None
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    if cache is not None:
+                        cache.close()
+                    return
+                if cache is None:
+                    cache = RenderCache()
+                cache.put(**item)
+            except Exception as e:
+                # Une erreur ne doit pas arrêter le thread (flush() attendrait indéfiniment)
+                print(f"    ⚠️ Render cache error for {item['url']}: {type(e).__name__}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def submit(self, **item):
+        self._queue.put(item)
+
+    def flush(self):
+        """Attend que toutes les pages soumises soient écrites"""
+        self._queue.join()
+
+
+_writer = None
+
+
+def get_cache_writer():
+    """Writer partagé du processus (None si désactivé par RENDER_CACHE_ENABLED / --no-cache)"""
+    global _writer
+    if not config.RENDER_CACHE_ENABLED:
+        return None
+    if _writer is None:
+        _writer = CacheWriter()
+    return _writer
+
+
+def store_rendered_page(final_url, html, requested_url=None, response=None, source=None):
+    """Met en cache une page rendue par playwright, sans bloquer ni faire échouer le scraping"""
+    writer = get_cache_writer()
+    if writer is None:
+        return
+    # Les objets playwright ne se lisent que depuis la boucle asyncio : statut et en-têtes sont copiés ici
+    status = response.status if response is not None else None
+    headers = dict(response.headers) if response is not None else None
+    writer.submit(url=final_url, html=html, requested_url=requested_url, status=status, headers=headers, source=source)
+
+
+def flush_render_cache():
+    """Attend la fin des écritures en attente (fin de crawl)"""
+    if _writer is not None:
+        _writer.flush()
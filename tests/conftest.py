@@ -0,0 +1,112 @@
+import asyncio
+import os
+import sys
+import types
+import pytest
+
+# Les modules du projet sont à la racine du dépôt (pas de package)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+
+@pytest.fixture(autouse=True)
+def isolated_paths(tmp_path, monkeypatch):
+    """Sorties, fichier visited et cache de rendu dans un dossier temporaire"""
+    monkeypatch.setattr(config, "OUTPUT_ROOT", str(tmp_path / "out"))
+    monkeypatch.setattr(config, "VISITED_FILE", str(tmp_path / "visited.txt"))
+    monkeypatch.setattr(config, "RENDER_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(config, "RENDER_CACHE_ENABLED", False)
+    monkeypatch.setattr(config, "TIMEOUTWAIT", 0)
+    return tmp_path
+
+
+class FakeBrowser:
+    """Navigateur simulé : site = {url: (html, liens)}, failing = URLs en erreur réseau
+    new_page_limit : nombre d'onglets ouverts avant que new_page() ne lève (navigateur planté)"""
+
+    def __init__(self, site, failing=(), new_page_limit=None, delay=0.001):
+        self.site = site
+        self.failing = set(failing)
+        self.new_page_limit = new_page_limit
+        self.delay = delay
+        self.pages_opened = 0
+        self.visited = []
+        self.closed = False
+
+    def module(self):
+        """Module playwright.async_api de remplacement"""
+        browser = self
+
+        class Response:
+            status = 200
+            headers = {"content-type": "text/html"}
+
+        class Page:
+            def __init__(self):
+                self.url = None
+
+            async def goto(self, url, timeout=None, wait_until=None):
+                browser.visited.append(url)
+                await asyncio.sleep(browser.delay)
+                if url in browser.failing:
+                    raise Exception("net::ERR_FAILED")
+                self.url = url
+                return Response()
+
+            async def wait_for_timeout(self, ms):
+                await asyncio.sleep(0)
+
+            async def evaluate(self, js, arg=None):
+                if js == "window.location.href":
+                    return self.url
+                return list(browser.site.get(self.url, ("", []))[1])
+
+            async def content(self):
+                return browser.site.get(self.url, ("", []))[0]
+
+            async def close(self):
+                pass
+
+        class Context:
+            async def new_page(self):
+                if browser.new_page_limit is not None and browser.pages_opened >= browser.new_page_limit:
+                    raise RuntimeError("Target closed")
+                browser.pages_opened += 1
+                return Page()
+
+        class Browser:
+            async def new_context(self):
+                return Context()
+
+            async def close(self):
+                browser.closed = True
+
+        class Chromium:
+            async def launch(self, headless=True):
+                return Browser()
+
+        class Playwright:
+            chromium = Chromium()
+
+        class Manager:
+            async def __aenter__(self):
+                return Playwright()
+
+            async def __aexit__(self, *exc):
+                return False
+
+        module = types.ModuleType("playwright.async_api")
+        module.async_playwright = Manager
+        return module
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    """Installe un playwright simulé ; retourne la fabrique du navigateur"""
+    def install(site, **kwargs):
+        browser = FakeBrowser(site, **kwargs)
+        monkeypatch.setitem(sys.modules, "playwright", types.ModuleType("playwright"))
+        monkeypatch.setitem(sys.modules, "playwright.async_api", browser.module())
+        return browser
+    return install
@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+import config
+import engine as engine_module
+from discovery import LinkDiscovery, PaginationDiscovery
+from engine import CrawlEngine
+from frontier import CrawlLimits
+
+BASE = "https://ex.com/docs"
+PAGE = '<html><head><title>T</title></head><body><div data-main-column><div class="content"><p>x</p></div></div></body></html>'
+
+
+def tree_site(count, fanout=3):
+    """Site en arbre : la page i contient des liens vers ses `fanout` enfants"""
+    site = {}
+    for i in range(count):
+        children = [f"{BASE}/p{j}" for j in range(i * fanout + 1, i * fanout + fanout + 1) if j < count]
+        site[f"{BASE}/p{i}" if i else BASE] = (PAGE, children)
+    return site
+
+
+def make_engine(tmp_path, discovery, limits=None):
+    return CrawlEngine(discovery, "data-main-column", "content", str(tmp_path / "out" / "S"),
+                       set(), set(), limits or CrawlLimits(), source="S")
+
+
+def run(engine, timeout=10):
+    # Le délai transforme un blocage du moteur en échec du test
+    return asyncio.run(asyncio.wait_for(engine.run(), timeout))
+
+
+def test_base_crawl_visits_every_page_once(tmp_path, fake_browser):
+    browser = fake_browser(tree_site(30))
+    engine = make_engine(tmp_path, LinkDiscovery(BASE))
+
+    run(engine)
+
+    assert sorted(browser.visited) == sorted(tree_site(30))
+    assert engine.limits.pages_fetched == 30
+    assert browser.closed
+
+
+def test_page_budget_is_respected(tmp_path, fake_browser):
+    browser = fake_browser(tree_site(30))
+    engine = make_engine(tmp_path, LinkDiscovery(BASE), CrawlLimits(max_pages=7))
+
+    run(engine)
+
+    assert len(browser.visited) == 7
+    assert engine.limits.pages_fetched == 7
+
+
+def test_queued_urls_are_skipped_after_time_budget(tmp_path, fake_browser, monkeypatch):
+    monkeypatch.setattr(config, "FETCH_CONCURRENCY", 2)
+    browser = fake_browser(tree_site(200, fanout=10), delay=0.05)
+    engine = make_engine(tmp_path, LinkDiscovery(BASE), CrawlLimits(time_budget=0.08))
+
+    run(engine)
+
+    # La graine puis au plus un lot de pages en cours au moment de l'échéance
+    assert len(browser.visited) <= 1 + 2 * 2
+    assert engine.limits.pages_fetched == len(browser.visited)
+
+
+def test_shutdown_when_tabs_cannot_be_replaced(tmp_path, fake_browser):
+    site = tree_site(40)
+    failing = [url for url in site if url.endswith(("1", "3", "5"))]
+    browser = fake_browser(site, failing=failing, new_page_limit=config.FETCH_CONCURRENCY + 1)
+    engine = make_engine(tmp_path, LinkDiscovery(BASE))
+
+    run(engine, timeout=5)
+
+    assert engine._fatal and engine._fatal.startswith("browser lost")
+    assert browser.closed
+
+
+def test_render_cache_is_flushed_when_the_crawl_fails(tmp_path, fake_browser, monkeypatch):
+    fake_browser(tree_site(5))
+    flushed = []
+    monkeypatch.setattr(engine_module, "flush_render_cache", lambda: flushed.append(True))
+    engine = make_engine(tmp_path, LinkDiscovery(BASE))
+
+    async def crash():
+        raise RuntimeError("scheduler crashed")
+    monkeypatch.setattr(engine, "_schedule", crash)
+
+    with pytest.raises(RuntimeError):
+        run(engine)
+    assert flushed == [True]
+
+
+def test_blog_listing_error_counts_as_empty_and_pages_overlap(tmp_path, fake_browser):
+    site = {}
+    for n in range(1, 5):
+        articles = [f"https://blog.com/2024/post{n}{k}" for k in range(8)]
+        site[f"https://blog.com/news?page={n}"] = ("", articles)
+        for url in articles:
+            site[url] = (PAGE, [])
+    browser = fake_browser(site, failing=["https://blog.com/news?page=1"])
+    engine = make_engine(tmp_path, PaginationDiscovery("https://blog.com/news?page=1"))
+
+    run(engine)
+
+    visited = browser.visited
+    # La page 1 en erreur ne stoppe pas la source ; la page 3 est chargée avant la fin des articles de la page 2
+    assert not engine.discovery.stopped
+    assert "https://blog.com/2024/post40" in visited
+    assert visited.index("https://blog.com/news?page=3") < visited.index("https://blog.com/2024/post27")
+    assert "https://blog.com/2024/post10" not in visited
@@ -0,0 +1,64 @@
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("html2text")
+
+from extraction import ExtractionError, get_profile
+
+# Résultats attendus produits par fetch.py / fetch_blog.py avant le moteur commun, sur la même page
+PAGE = """<html><head><title> Release notes </title><style>p{}</style></head><body>
+<header>Site header</header>
+<div data-main-column>
+  <nav><a href="/a">Menu</a></nav>
+  <script>var x = 1;</script>
+  <div class="content"><h2>Install</h2><p>Run <code>pip install</code> then see <a href="https://ex.com/docs">the docs</a>.</p></div>
+  <aside>Related</aside>
+  <div class="content"><ul><li>one</li><li>two</li></ul></div>
+  <div class="post-content"><p>Post body</p></div>
+  <footer>Footer</footer>
+</div></body></html>"""
+
+CONTENT_MD = "## Install\n\nRun `pip install` then see [the docs](https://ex.com/docs).\n\n  * one\n  * two\n\n\n"
+
+
+def test_base_matches_baseline():
+    assert get_profile("data-main-column", "content", "Base").extract(PAGE) == "# " + CONTENT_MD
+
+
+def test_blog_matches_baseline():
+    assert get_profile("data-main-column", "content", "Blog").extract(PAGE) == "# Release notes\n\n" + CONTENT_MD
+
+
+def test_blog_falls_back_to_post_content():
+    assert get_profile("data-main-column", "missing", "Blog").extract(PAGE) == "# Release notes\n\nPost body\n"
+
+
+def test_blog_without_keep_class_keeps_main_container():
+    assert get_profile("data-main-column", "", "Blog").extract(PAGE) == "# Release notes\n\n" + CONTENT_MD + "\nPost body\n"
+
+
+def test_sitemap_uses_blog_rules():
+    assert get_profile("data-main-column", "content", "Sitemap").extract(PAGE) == \
+        get_profile("data-main-column", "content", "Blog").extract(PAGE)
+
+
+def test_class_main_container():
+    html = '<div class="article"><div class="body"><p>Text</p></div></div>'
+    assert get_profile("article", "body", "Base").extract(html) == "# Text\n"
+
+
+def test_base_requires_main_container():
+    with pytest.raises(ExtractionError, match="Aucune section data-missing trouvée"):
+        get_profile("data-missing", "content", "Base").extract(PAGE)
+
+
+@pytest.mark.parametrize("keep", ["missing", ""])
+def test_base_requires_content_blocks(keep):
+    with pytest.raises(ExtractionError, match="Pas de blocs"):
+        get_profile("data-main-column", keep, "Base").extract(PAGE)
+
+
+def test_profile_is_shared_and_converter_state_does_not_leak():
+    profile = get_profile("data-main-column", "content", "Base")
+    assert get_profile(" data-main-column ", "content", "Base") is profile
+    assert profile.extract(PAGE) == profile.extract(PAGE)
@@ -0,0 +1,97 @@
+import time
+from frontier import CrawlLimits, Frontier, score_url
+
+
+def test_pop_order_follows_depth_then_insertion():
+    frontier = Frontier()
+    frontier.push("https://ex.com/docs", depth=0, seed=True)
+    frontier.push("https://ex.com/docs/b", depth=1)
+    frontier.push("https://ex.com/docs/a", depth=1)
+    frontier.push("https://ex.com/docs/a/deep", depth=2)
+
+    assert [frontier.pop()[0] for _ in range(len(frontier))] == [
+        "https://ex.com/docs",
+        "https://ex.com/docs/b",
+        "https://ex.com/docs/a",
+        "https://ex.com/docs/a/deep",
+    ]
+
+
+def test_priority_and_low_value_patterns_reorder_same_depth():
+    limits = CrawlLimits(priority=CrawlLimits.from_entry({"priority": "/guide/"}).priority)
+    frontier = Frontier(limits)
+    frontier.push("https://ex.com/tag/python", depth=1)
+    frontier.push("https://ex.com/blog/post", depth=1)
+    frontier.push("https://ex.com/guide/start", depth=1)
+
+    assert [frontier.pop()[0] for _ in range(3)] == [
+        "https://ex.com/guide/start",
+        "https://ex.com/blog/post",
+        "https://ex.com/tag/python",
+    ]
+
+
+def test_recent_year_scores_before_old_year():
+    assert score_url("https://ex.com/2024/post", 1, current_year=2025) < score_url("https://ex.com/2015/post", 1, current_year=2025)
+
+
+def test_push_deduplicates_normalized_urls():
+    frontier = Frontier()
+    assert frontier.push("https://ex.com/Page/", depth=1)
+    assert not frontier.push("https://ex.com/page", depth=1)
+    assert len(frontier) == 1
+
+
+def test_push_applies_depth_include_and_exclude_except_for_seeds():
+    limits = CrawlLimits.from_entry({"max_depth": "1", "include": "/docs", "exclude": "draft"})
+    frontier = Frontier(limits)
+
+    assert frontier.push("https://ex.com/start", depth=0, seed=True)
+    assert frontier.push("https://ex.com/docs/a", depth=1)
+    assert not frontier.push("https://ex.com/docs/a/b", depth=2)
+    assert not frontier.push("https://ex.com/blog/a", depth=1)
+    assert not frontier.push("https://ex.com/docs/draft", depth=1)
+
+
+def test_from_entry_reads_csv_cells():
+    limits = CrawlLimits.from_entry({
+        "max_depth": "3", "max_pages": "50.0", "time_budget": "2m",
+        "max_listing_pages": "7", "max_empty_pages": "",
+    })
+
+    assert (limits.max_depth, limits.max_pages, limits.time_budget) == (3, 50, 120)
+    assert limits.max_listing_pages == 7
+    assert limits.max_empty_pages == CrawlLimits().max_empty_pages
+
+
+def test_from_entry_falls_back_on_invalid_cells(capsys):
+    limits = CrawlLimits.from_entry({
+        "url": "https://ex.com", "max_pages": "inf", "max_depth": "abc",
+        "time_budget": "soon", "include": "[bad",
+    })
+
+    assert limits.max_pages == CrawlLimits().max_pages
+    assert limits.max_depth == CrawlLimits().max_depth
+    assert limits.time_budget == CrawlLimits().time_budget
+    assert limits.include is None
+    assert "Invalid include pattern" in capsys.readouterr().out
+
+
+def test_exhausted_by_page_budget():
+    limits = CrawlLimits(max_pages=2)
+    limits.start()
+    limits.count_page()
+    assert limits.exhausted() is None
+    limits.count_page()
+    assert limits.exhausted() == "page budget reached (2)"
+    limits.uncount_page()
+    assert limits.exhausted() is None
+
+
+def test_exhausted_by_time_budget():
+    limits = CrawlLimits(time_budget=0.01)
+    limits.start()
+    assert not limits.out_of_time()
+    time.sleep(0.02)
+    assert limits.out_of_time()
+    assert limits.exhausted().startswith("time budget reached")
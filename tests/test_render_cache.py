@@ -0,0 +1,106 @@
+import os
+import pytest
+import config
+import render_cache
+from render_cache import EVICT_LOW_WATER, RenderCache
+
+
+def blob_files(cache):
+    return sorted(name for _, _, files in os.walk(os.path.join(cache.root, "blobs")) for name in files)
+
+
+def disk_size(cache):
+    return sum(os.path.getsize(cache.blob_path(name[:-len(".html.gz")])) for name in blob_files(cache))
+
+
+def page(n, size=2000):
+    # Contenu peu compressible pour que la taille des blobs soit prévisible
+    return os.urandom(size).hex() + str(n)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = RenderCache(root=str(tmp_path / "cache"), max_bytes=0)
+    yield cache
+    cache.close()
+
+
+def test_put_and_get_round_trip(cache):
+    cache.put("https://ex.com/a", "<html>é</html>", requested_url="https://ex.com/A", status=200,
+              headers={"content-type": "text/html"}, source="DOCS")
+
+    assert cache.get("https://ex.com/a") == "<html>é</html>"
+    entry = cache.entry("https://ex.com/a")
+    assert (entry["source"], entry["requested_url"], entry["status"]) == ("DOCS", "https://ex.com/A", 200)
+    assert entry["headers"] == {"content-type": "text/html"}
+    assert cache.get("https://ex.com/missing") is None
+
+
+def test_identical_pages_share_one_blob(cache):
+    cache.put("https://ex.com/a", "<html>same</html>")
+    cache.put("https://ex.com/b", "<html>same</html>")
+
+    assert len(blob_files(cache)) == 1
+    assert cache._total == disk_size(cache)
+
+
+def test_replacing_a_page_drops_its_old_blob(cache):
+    cache.put("https://ex.com/a", page(1))
+    cache.put("https://ex.com/a", page(2))
+
+    assert len(blob_files(cache)) == 1
+    assert cache._total == disk_size(cache)
+
+
+def test_total_is_recomputed_on_open(cache):
+    for n in range(3):
+        cache.put(f"https://ex.com/{n}", page(n))
+    cache.put("https://ex.com/copy", cache.get("https://ex.com/0"))
+
+    reopened = RenderCache(root=cache.root, max_bytes=0)
+    assert reopened._total == cache._total == disk_size(cache)
+    reopened.close()
+
+
+def test_evicts_least_recently_used_down_to_low_water(cache):
+    for n in range(10):
+        cache.put(f"https://ex.com/{n}", page(n))
+    cache.touch(["https://ex.com/0"])
+    cache.max_bytes = cache._total
+
+    cache.put("https://ex.com/new", page(10))
+
+    urls = [entry["url"] for entry in cache.entries()]
+    assert "https://ex.com/new" in urls
+    assert "https://ex.com/0" in urls
+    assert "https://ex.com/1" not in urls
+    assert cache._total <= cache.max_bytes * EVICT_LOW_WATER
+    assert cache._total == disk_size(cache)
+
+
+def test_never_evicts_the_page_just_written(cache):
+    cache.put("https://ex.com/old", page(1, size=100))
+    cache.max_bytes = 300
+
+    cache.put("https://ex.com/big", page(2))
+
+    assert [entry["url"] for entry in cache.entries()] == ["https://ex.com/big"]
+    assert cache._total == disk_size(cache)
+
+
+def test_store_rendered_page_goes_through_the_writer_thread(monkeypatch):
+    monkeypatch.setattr(config, "RENDER_CACHE_ENABLED", True)
+    monkeypatch.setattr(render_cache, "_writer", None)
+
+    class Response:
+        status = 200
+        headers = {"content-type": "text/html"}
+
+    render_cache.store_rendered_page("https://ex.com/a", "<html>a</html>", "https://ex.com/a", Response(), source="DOCS")
+    render_cache.store_rendered_page("https://ex.com/bad", "\ud800", None, None)
+    render_cache.flush_render_cache()
+
+    cache = RenderCache()
+    assert [entry["url"] for entry in cache.entries()] == ["https://ex.com/a"]
+    assert cache.entry("https://ex.com/a")["source"] == "DOCS"
+    cache.close()
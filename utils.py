@@ -1,10 +1,11 @@
-import pandas as pd
-from playwright.async_api import async_playwright
+import csv
 from datetime import datetime
 from urllib.parse import urlparse
 import os
 import hashlib
-from config import VISITED_FILE, UNWANTED_KEYWORDS
+import math
+import config
+from config import UNWANTED_KEYWORDS
 from urllib.parse import urlparse, urlunparse
 
 def clean_link_fragment(url):
@@ -13,29 +14,67 @@ def clean_link_fragment(url):
     return urlunparse(cleaned).rstrip('/')
 
 def load_visited_urls():
-    if not os.path.exists(VISITED_FILE):
+    if not os.path.exists(config.VISITED_FILE):
         return set()
-    with open(VISITED_FILE, "r", encoding="utf-8") as f:
+    with open(config.VISITED_FILE, "r", encoding="utf-8") as f:
         return set(line.strip().split(" | ")[0] for line in f if line.strip())
     
 def save_visited_url(url):
     timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-    with open(VISITED_FILE, "a", encoding="utf-8") as f:
+    with open(config.VISITED_FILE, "a", encoding="utf-8") as f:
         f.write(f"{url} | {timestamp}\n")
 
 def load_urls_from_csv(filepath):
-    df = pd.read_csv(filepath)
-    df = df.applymap(lambda x: x.strip() if isinstance(x, str) else x)
-    if 'scraped' not in df.columns:
-        df['scraped'] = False
-    df['scraped'] = df['scraped'].fillna(False).astype(bool)
-    return df.to_dict('records')
+    """Lit le CSV des sources (sans pandas) : cellules nettoyées, cellules vides -> ''"""
+    entries = []
+    # utf-8-sig : tolère le BOM des CSV enregistrés depuis Excel
+    with open(filepath, "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            entry = {
+                (key or "").strip(): (value or "").strip()
+                for key, value in row.items()
+                if key is not None
+            }
+            if not entry.get('url'):
+                continue
+            entry['scraped'] = entry.get('scraped', '').lower() in ("1", "true", "yes", "oui", "x")
+            entries.append(entry)
+    return entries
+
+def is_blank_cell(value):
+    """Cellule CSV vide (None, NaN pandas ou chaîne vide)"""
+    if value is None:
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return True
+    return isinstance(value, str) and not value.strip()
+
+def source_project_dir(source, output_root=None):
+    """Dossier de sortie d'une source (nom de dossier sécurisé sous OUTPUT_ROOT)"""
+    safe_source = source.replace("/", "_").replace("\\", "_").replace(" ", "_")
+    return os.path.join(output_root or config.OUTPUT_ROOT, safe_source)
+
+def save_markdown(project_dir, final_url, markdown_content):
+    """Écrit le markdown d'une page avec l'en-tête URL / date et retourne le chemin du fichier"""
+    safe_filename = sanitize_filename(final_url)
+    os.makedirs(project_dir, exist_ok=True)
+    file_path = os.path.join(project_dir, f"{safe_filename}.md")
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(f"<!-- URL: {final_url} | Scraped at: {datetime.utcnow()} -->\n\n")
+        f.write(markdown_content)
+
+    return file_path
+
+def has_unwanted_keyword(url):
+    """URL contenant un des mots-clés de UNWANTED_KEYWORDS (sans tenir compte de la casse)"""
+    url_lower = url.lower()
+    return any(keyword.lower() in url_lower for keyword in UNWANTED_KEYWORDS)
 
 def is_unwanted_url(url, base_url):
     if not url.startswith(base_url):
         return True
-    url_lower = url.lower()
-    return any(keyword in url_lower for keyword in UNWANTED_KEYWORDS)
+    return has_unwanted_keyword(url)
 
 def sanitize_filename(url, max_length=100):
     """Crée un nom de fichier sûr à partir d'une URL"""